@@ -1,10 +1,16 @@
+import functools
 import json
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
 
+CPP_SOURCE_SUFFIXES = (".cpp", ".cc")
+
+
 @dataclass
 class ProjectConfig:    
     compiler: str = "clang++"
@@ -40,17 +46,21 @@ class ProjectConfig:
 
 
 def find_cpp_files(project_root: Path, excluded_dirs: List[str]) -> List[Path]:
+    excluded = frozenset(excluded_dirs)
     cpp_files = []
     
-    for pattern in ["**/*.cpp", "**/*.cc"]:
-        for file in project_root.glob(pattern):
-            if not any(excluded in file.parts for excluded in excluded_dirs):
-                cpp_files.append(file)
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        # Pruning in place stops os.walk from descending into excluded subtrees
+        dirnames[:] = [d for d in dirnames if d not in excluded]
+        for filename in filenames:
+            if filename.endswith(CPP_SOURCE_SUFFIXES):
+                cpp_files.append(Path(dirpath) / filename)
     
     return sorted(cpp_files)
 
 
-def find_bazel_external_lib(lib_patterns: List[str], subpath: str = "") -> Optional[str]:
+@functools.lru_cache(maxsize=1)
+def _bazel_output_base() -> Optional[Path]:
     try:
         result = subprocess.run(
             ["bazel", "info", "output_base"],
@@ -58,17 +68,24 @@ def find_bazel_external_lib(lib_patterns: List[str], subpath: str = "") -> Optio
             text=True,
             check=True
         )
-        output_base = Path(result.stdout.strip())
-        external_dir = output_base / "external"
-        
-        for pattern in lib_patterns:
-            for lib_dir in external_dir.glob(pattern):
-                check_path = lib_dir / subpath if subpath else lib_dir
-                if check_path.exists():
-                    return str(lib_dir)
-        
     except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
+        return None
+    
+    return Path(result.stdout.strip())
+
+
+def find_bazel_external_lib(lib_patterns: List[str], subpath: str = "") -> Optional[str]:
+    output_base = _bazel_output_base()
+    if output_base is None:
+        return None
+    
+    external_dir = output_base / "external"
+    
+    for pattern in lib_patterns:
+        for lib_dir in external_dir.glob(pattern):
+            check_path = lib_dir / subpath if subpath else lib_dir
+            if check_path.exists():
+                return str(lib_dir)
     
     return None
 
@@ -94,20 +111,27 @@ def find_benchmark_include() -> Optional[str]:
     )
 
 
+def build_include_flags(project_root: Path, include_mappings: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    return {
+        dir_marker: [f"-I{project_root / include_dir}" for include_dir in include_dirs]
+        for dir_marker, include_dirs in include_mappings.items()
+    }
+
+
 def get_include_paths(
     file_path: Path, 
     project_root: Path, 
     gtest_path: Optional[str],
     spdlog_path: Optional[str],
     benchmark_path: Optional[str],
-    include_mappings: Dict[str, List[str]]
+    include_flags: Dict[str, List[str]]
 ) -> List[str]:
     includes = [f"-I{project_root}"]
     
-    for dir_marker, include_dirs in include_mappings.items():
-        if dir_marker in file_path.parts:
-            for include_dir in include_dirs:
-                includes.append(f"-I{project_root / include_dir}")
+    parts = file_path.parts
+    for dir_marker, flags in include_flags.items():
+        if dir_marker in parts:
+            includes.extend(flags)
     
     if gtest_path:
         includes.append(f"-I{gtest_path}/googletest/include")
@@ -119,7 +143,8 @@ def get_include_paths(
     if benchmark_path:
         includes.append(f"-I{benchmark_path}/include")
     
-    return includes
+    # Several markers share directories (e.g. logging/include); keep the first occurrence
+    return list(dict.fromkeys(includes))
 
 
 def create_compile_command(
@@ -128,16 +153,23 @@ def create_compile_command(
     gtest_path: Optional[str],
     spdlog_path: Optional[str],
     benchmark_path: Optional[str],
-    config: ProjectConfig
+    config: ProjectConfig,
+    include_flags: Optional[Dict[str, List[str]]] = None
 ) -> Dict:
-    includes = get_include_paths(file_path, project_root, gtest_path, spdlog_path, benchmark_path, config.include_mappings)
+    if include_flags is None:
+        include_flags = build_include_flags(project_root, config.include_mappings)
+    
+    includes = get_include_paths(file_path, project_root, gtest_path, spdlog_path, benchmark_path, include_flags)
     flags = [f"-std={config.cpp_standard}"] + config.common_flags
     
-    arguments = [config.compiler, "-c"] + flags + includes + [str(file_path.resolve())]
+    # Both paths are already absolute: project_root is resolved once by the caller
+    # and find_cpp_files joins every source onto it
+    source = str(file_path)
+    arguments = [config.compiler, "-c"] + flags + includes + [source]
     
     return {
-        "directory": str(project_root.resolve()),
-        "file": str(file_path.resolve()),
+        "directory": str(project_root),
+        "file": source,
         "arguments": arguments
     }
 
@@ -149,19 +181,28 @@ def generate_compile_commands(
     if config is None:
         config = ProjectConfig()
     
-    project_root = Path.cwd()
-    cpp_files = find_cpp_files(project_root, config.excluded_dirs)
+    project_root = Path.cwd().resolve()
+    
+    # Warm the bazel output_base cache while the source tree is being walked
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        output_base_future = executor.submit(_bazel_output_base)
+        cpp_files = find_cpp_files(project_root, config.excluded_dirs)
+        output_base_future.result()
+    
     gtest_path = find_gtest_include()
     spdlog_path = find_spdlog_include()
     benchmark_path = find_benchmark_include()
+    include_flags = build_include_flags(project_root, config.include_mappings)
     
     compile_commands = [
-        create_compile_command(file, project_root, gtest_path, spdlog_path, benchmark_path, config)
+        create_compile_command(
+            file, project_root, gtest_path, spdlog_path, benchmark_path, config, include_flags=include_flags
+        )
         for file in cpp_files
     ]
     
     with open(output_file, "w") as f:
-        json.dump(compile_commands, f, indent=2)
+        json.dump(compile_commands, f, separators=(",", ":"))
     
     print(f"Generated {output_file} with {len(cpp_files)} source files")
     print(f"Using compiler: {config.compiler}")